@@ -46,12 +46,20 @@ def load_config():
             "max_preview_rows": 5000,
             "max_preview_cols": 200,
             "max_image_pixels": 4000000,
+            "image_display_max": 1600,
             "float_precision": 8,
+            "stats_full_read_bytes": 512 * 1024 * 1024,
             "sidebar_width": 300,
         },
+        "hdf5": {
+            "rdcc_nbytes": 64 * 1024 * 1024,
+            "rdcc_nslots": 100003,
+            "rdcc_w0": 0.75,
+        },
         "export": {
             "csv_separator": ",",
             "csv_line_ending": "\n",
+            "float_format": "auto",
             "default_format": "csv",
         },
         "recent_files": [],
@@ -202,6 +210,7 @@ def main():
             window.evaluate_js(f"openFile({json.dumps(os.path.abspath(file_arg))})")
 
     window.events.loaded += on_loaded
+    window.events.closed += app.shutdown
     webview.start(debug=False)
 
 
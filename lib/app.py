@@ -5,10 +5,24 @@ Exposes H5Engine to the pywebview frontend via JS-Python API bridge.
 
 import json
 import os
+import queue
+import threading
+import uuid
 import webview
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from .h5engine import H5Engine
 
+try:
+    # Optional, faster serializer for job results pushed to the frontend
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
 
 class App:
     """pywebview JS API - every public method is callable from JavaScript."""
@@ -18,10 +32,27 @@ class App:
         self.config_path = config_path
         self.engine = H5Engine(config)
         self._window: webview.Window | None = None
+        # Config writes are coalesced on a background thread
+        self._save_queue: queue.Queue = queue.Queue()
+        self._last_saved: str | None = None
+        self._writer = threading.Thread(target=self._config_writer, daemon=True)
+        self._writer.start()
+        # Slow engine calls run here so the JS bridge thread stays free
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._jobs: dict[str, Future] = {}
+        self._closing = False
 
     def set_window(self, window: webview.Window):
         self._window = window
 
+    def shutdown(self):
+        """Window-closed hook: drop queued jobs, stop pushing results to JS
+        and flush any pending config write."""
+        self._closing = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._save_queue.put(None)
+        self._writer.join(timeout=5)
+
     # -- File Operations ----------------------------------------------
 
     def open_file_dialog(self) -> dict:
@@ -52,6 +83,9 @@ class App:
 
     # -- Data Access --------------------------------------------------
 
+    def list_children(self, path: str) -> dict:
+        return self.engine.list_children(path)
+
     def get_data(self, path: str) -> dict:
         return self.engine.get_data(path)
 
@@ -62,10 +96,10 @@ class App:
         return self.engine.get_details(path)
 
     def get_stats(self, path: str) -> dict:
-        return self.engine.get_stats(path)
+        return self._submit(self.engine.get_stats, path)
 
     def get_image(self, path: str) -> dict:
-        return self.engine.get_image_base64(path)
+        return self._submit(self.engine.get_image_base64, path)
 
     # -- Export --------------------------------------------------------
 
@@ -86,7 +120,45 @@ class App:
             return {"ok": False, "error": "cancelled"}
 
         save_path = result if isinstance(result, str) else result[0]
-        return self.engine.export_csv(dataset_path, save_path)
+        return self._submit(self.engine.export_csv, dataset_path, save_path)
+
+    # -- Background Jobs ----------------------------------------------
+
+    def cancel_job(self, job_id: str) -> dict:
+        """Cancel a job that has not started yet; JS then gets a 'cancelled' result."""
+        fut = self._jobs.get(job_id)
+        return {"ok": bool(fut and fut.cancel())}
+
+    def _submit(self, fn, *args) -> dict:
+        """Run ``fn`` on the worker pool and return a job id immediately.
+
+        The result is delivered later through ``jobDone(job_id, result)`` in
+        the page. Without a window there is nowhere to push to, so the call
+        runs inline instead.
+        """
+        if not self._window:
+            return fn(*args)
+        job_id = uuid.uuid4().hex
+        fut = self._executor.submit(fn, *args)
+        self._jobs[job_id] = fut
+        fut.add_done_callback(lambda f: self._finish_job(job_id, f))
+        return {"ok": True, "job_id": job_id}
+
+    def _finish_job(self, job_id: str, fut: Future):
+        self._jobs.pop(job_id, None)
+        if self._closing:
+            return
+        if fut.cancelled():
+            res = {"ok": False, "error": "cancelled"}
+        else:
+            try:
+                res = fut.result()
+            except Exception as e:
+                res = {"ok": False, "error": str(e)}
+        try:
+            self._window.evaluate_js(f"jobDone({json.dumps(job_id)}, {_dumps(res)})")
+        except Exception:
+            pass
 
     # -- Config / Recent Files ----------------------------------------
 
@@ -111,8 +183,44 @@ class App:
         self._save_config()
 
     def _save_config(self):
+        """Queue the current config for writing on the background thread."""
+        self._save_queue.put(json.dumps(self.config, indent=2, ensure_ascii=False))
+
+    def _config_writer(self):
+        """Write queued configs, keeping only the latest of a burst.
+
+        A ``None`` in the queue (from ``shutdown``) makes the thread write
+        whatever is still pending and exit.
+        """
+        while True:
+            text = self._save_queue.get()
+            stop = text is None
+            try:
+                while True:
+                    nxt = self._save_queue.get_nowait()
+                    if nxt is None:
+                        stop = True
+                    else:
+                        text = nxt
+            except queue.Empty:
+                pass
+            # Only the newest snapshot matters; skip it if it is already on disk
+            if text is not None and text != self._last_saved:
+                self._write_config(text)
+            if stop:
+                return
+
+    def _write_config(self, text: str):
+        """Write to a temp file and swap it in with os.replace.
+
+        This is atomic without paying for an fsync. ``_last_saved`` only
+        advances on success, so a failed write is retried on the next save.
+        """
+        tmp = self.config_path + ".tmp"
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, self.config_path)
+            self._last_saved = text
         except Exception:
             pass
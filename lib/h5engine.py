@@ -10,8 +10,17 @@ import os
 import csv
 import io
 import base64
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
+try:
+    # Optional SIMD base64 encoder, noticeably faster on large PNG payloads
+    from pybase64 import b64encode_as_string
+except ImportError:
+    def b64encode_as_string(data: bytes) -> str:
+        return base64.b64encode(data).decode("ascii")
+
 
 class H5Engine:
     """Core HDF5 reading engine."""
@@ -20,6 +29,16 @@ class H5Engine:
         self.config = config
         self.file: h5py.File | None = None
         self.filepath: str = ""
+        # Reusable read buffers keyed by (shape, dtype), LRU bounded by count
+        # and total bytes; buffers above a quarter of the budget aren't kept
+        self._scratch: OrderedDict = OrderedDict()
+        self._scratch_max = 8
+        self._scratch_max_bytes = 64 * 1024 * 1024
+        self._scratch_lock = threading.Lock()
+        # Resolved groups keyed by path, bounded LRU; cleared on close()
+        self._objects: OrderedDict = OrderedDict()
+        self._objects_max = 256
+        self._objects_lock = threading.Lock()
 
     # -- File Operations ----------------------------------------------
 
@@ -27,7 +46,13 @@ class H5Engine:
         """Open an HDF5 file and return its tree structure."""
         self.close()
         try:
-            self.file = h5py.File(filepath, "r")
+            cache = self.config.get("hdf5", {})
+            self.file = h5py.File(
+                filepath, "r",
+                rdcc_nbytes=cache.get("rdcc_nbytes", 64 * 1024 * 1024),
+                rdcc_nslots=cache.get("rdcc_nslots", 100003),
+                rdcc_w0=cache.get("rdcc_w0", 0.75),
+            )
             self.filepath = filepath
             tree = self._build_tree(self.file, "/")
             size = os.path.getsize(filepath)
@@ -51,6 +76,10 @@ class H5Engine:
                 pass
             self.file = None
             self.filepath = ""
+        with self._scratch_lock:
+            self._scratch.clear()
+        with self._objects_lock:
+            self._objects.clear()
 
     def is_open(self) -> bool:
         return self.file is not None
@@ -58,72 +87,116 @@ class H5Engine:
     # -- Tree Building ------------------------------------------------
 
     def _build_tree(self, obj, path: str) -> dict:
-        """Recursively build a JSON-serializable tree from an HDF5 group."""
+        """Build a JSON-serializable node for a group and its immediate children.
+
+        Child groups are returned as lazy stubs (``"lazy": True``) and are
+        expanded on demand through ``list_children``.
+        """
+        node = self._group_node(obj, path)
+        node["children"] = self._child_nodes(obj, path)
+        node["lazy"] = False
+        return node
+
+    def list_children(self, path: str) -> dict:
+        """List the immediate children of a group without recursing."""
+        if not self.file:
+            return {"ok": False, "error": "No file open"}
+        try:
+            obj = self._resolve(path)
+            if not isinstance(obj, h5py.Group):
+                return {"ok": False, "error": "Not a group"}
+            return {"ok": True, "path": path, "children": self._child_nodes(obj, path)}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def _group_node(self, obj, path: str) -> dict:
+        """Build an unexpanded group node."""
         name = "/" if path == "/" else path.rsplit("/", 1)[-1]
         node = {
             "name": name,
             "path": path,
             "type": "group",
             "children": [],
+            "lazy": True,
+            "child_count": 0,
             "attr_count": 0,
         }
-
-        # Attributes
         try:
             node["attr_count"] = len(obj.attrs)
         except Exception:
             pass
+        try:
+            node["child_count"] = len(obj)
+        except Exception:
+            pass
+        return node
 
-        # Iterate children
+    def _child_nodes(self, obj, path: str) -> list:
+        """Build nodes for the direct children of a group, groups first."""
         try:
-            keys = list(obj.keys())
+            keys = sorted(obj.keys())
         except Exception:
             keys = []
 
-        for key in sorted(keys):
-            child_path = f"{path.rstrip('/')}/{key}"
-            try:
-                child = obj[key]
-                if isinstance(child, h5py.Group):
-                    node["children"].append(self._build_tree(child, child_path))
-                elif isinstance(child, h5py.Dataset):
-                    ds_node = {
-                        "name": key,
-                        "path": child_path,
-                        "type": "dataset",
-                        "shape": list(child.shape),
-                        "dtype": str(child.dtype),
-                        "size": int(np.prod(child.shape)) if child.shape else 1,
-                        "nbytes": int(child.nbytes) if hasattr(child, "nbytes") else 0,
-                        "attr_count": len(child.attrs),
-                        "children": [],
-                    }
-                    # Check compression
-                    if child.compression:
-                        ds_node["compression"] = child.compression
-                        if child.compression_opts is not None:
-                            ds_node["compression_opts"] = str(child.compression_opts)
-                    if child.chunks:
-                        ds_node["chunks"] = list(child.chunks)
-                    node["children"].append(ds_node)
-                else:
-                    node["children"].append({
-                        "name": key,
-                        "path": child_path,
-                        "type": "unknown",
-                        "children": [],
-                    })
-            except Exception as e:
-                node["children"].append({
-                    "name": key,
-                    "path": child_path,
-                    "type": "error",
-                    "error": str(e),
-                    "children": [],
-                })
+        children = [self._child_node(obj, path, k) for k in keys]
 
         # Sort: groups first, then by name
-        node["children"].sort(key=lambda c: (0 if c["type"] == "group" else 1, c["name"]))
+        children.sort(key=lambda c: (0 if c["type"] == "group" else 1, c["name"]))
+        return children
+
+    def _child_node(self, obj, path: str, key: str) -> dict:
+        """Build the node for a single child link of a group."""
+        child_path = f"{path.rstrip('/')}/{key}"
+        try:
+            # Open by low-level id: skips h5py's high-level __getitem__ and
+            # lets dataset metadata come straight from the cached id/DCPL.
+            oid = h5py.h5o.open(obj.id, key.encode("utf-8"))
+            if isinstance(oid, h5py.h5g.GroupID):
+                return self._group_node(h5py.Group(oid), child_path)
+            if isinstance(oid, h5py.h5d.DatasetID):
+                return self._dataset_node(oid, key, child_path)
+            return {
+                "name": key,
+                "path": child_path,
+                "type": "unknown",
+                "children": [],
+            }
+        except Exception as e:
+            return {
+                "name": key,
+                "path": child_path,
+                "type": "error",
+                "error": str(e),
+                "children": [],
+            }
+
+    def _dataset_node(self, dsid, name: str, path: str) -> dict:
+        """Build a tree node for a dataset from its low-level DatasetID."""
+        shape = dsid.shape
+        dtype = dsid.dtype
+        size = int(np.prod(shape)) if shape else 1
+        node = {
+            "name": name,
+            "path": path,
+            "type": "dataset",
+            "shape": list(shape),
+            "dtype": str(dtype),
+            "size": size,
+            "nbytes": size * dtype.itemsize,
+            "attr_count": h5py.h5o.get_info(dsid).num_attrs,
+            "children": [],
+        }
+        # Read the creation property list once for compression and chunking
+        dcpl = dsid.get_create_plist()
+        filts = h5py.filters.get_filters(dcpl)
+        for comp in ("gzip", "lzf", "szip"):
+            if comp in filts:
+                node["compression"] = comp
+                if filts[comp] is not None:
+                    node["compression_opts"] = str(filts[comp])
+                break
+        if dcpl.get_layout() == h5py.h5d.CHUNKED:
+            node["chunks"] = list(dcpl.get_chunk())
         return node
 
     # -- Data Reading -------------------------------------------------
@@ -134,7 +207,7 @@ class H5Engine:
             return {"ok": False, "error": "No file open"}
 
         try:
-            obj = self.file[path]
+            obj = self._resolve(path)
             if not isinstance(obj, h5py.Dataset):
                 return {"ok": False, "error": "Not a dataset"}
 
@@ -157,13 +230,26 @@ class H5Engine:
                     "dtype": str(dtype),
                 }
 
+            # 1D compound - one column per field, each read by h5py's field reader
+            if len(shape) == 1 and dtype.names:
+                n = min(shape[0], max_rows)
+                cols = [self._vec_to_json(obj.fields(name)[:n], precision) for name in dtype.names]
+                rows = [[i, *vals] for i, vals in enumerate(zip(*cols))]
+                return {
+                    "ok": True,
+                    "mode": "1d",
+                    "headers": ["Index", *dtype.names],
+                    "rows": rows,
+                    "total_rows": shape[0],
+                    "shown_rows": n,
+                    "truncated": shape[0] > max_rows,
+                }
+
             # 1D
             if len(shape) == 1:
                 n = min(shape[0], max_rows)
-                data = obj[:n]
-                rows = []
-                for i in range(n):
-                    rows.append([i, self._to_json_val(data[i], precision)])
+                vals = self._read_values(obj, np.s_[:n], (n,), precision)
+                rows = [[i, vals[i]] for i in range(n)]
                 return {
                     "ok": True,
                     "mode": "1d",
@@ -178,18 +264,13 @@ class H5Engine:
             if len(shape) == 2:
                 nr = min(shape[0], max_rows)
                 nc = min(shape[1], max_cols)
-                data = obj[:nr, :nc]
+                vals = self._read_values(obj, np.s_[:nr, :nc], (nr, nc), precision)
                 headers = ["Row"] + [str(c) for c in range(nc)]
                 if nc < shape[1]:
                     headers.append("...")
-                rows = []
-                for r in range(nr):
-                    row = [r]
-                    for c in range(nc):
-                        row.append(self._to_json_val(data[r, c], precision))
-                    if nc < shape[1]:
-                        row.append("...")
-                    rows.append(row)
+                    rows = [[r, *vals[r], "..."] for r in range(nr)]
+                else:
+                    rows = [[r, *vals[r]] for r in range(nr)]
                 return {
                     "ok": True,
                     "mode": "2d",
@@ -203,11 +284,13 @@ class H5Engine:
                 }
 
             # 3D+ - flatten to index,value
-            flat = obj[()].flatten()
-            n = min(len(flat), max_rows)
-            rows = []
-            for i in range(n):
-                rows.append([i, self._to_json_val(flat[i], precision)])
+            n = min(total, max_rows)
+            sel = self._leading_selection(shape, n)
+            if h5py.check_string_dtype(dtype) is not None:
+                vals = obj.asstr(errors="backslashreplace")[sel].reshape(-1)[:n].tolist()
+            else:
+                vals = self._vec_to_json(obj[sel].reshape(-1)[:n], precision)
+            rows = [[i, vals[i]] for i in range(n)]
             return {
                 "ok": True,
                 "mode": "nd",
@@ -221,6 +304,34 @@ class H5Engine:
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
+    def _read_values(self, obj, sel, shape: tuple, precision: int) -> list:
+        """Read ``obj[sel]`` and convert it to nested JSON-friendly lists.
+
+        String datasets (fixed or variable length) are decoded by h5py's
+        ``asstr`` reader; everything else goes through a pooled buffer and
+        ``_vec_to_json``.
+        """
+        if h5py.check_string_dtype(obj.dtype) is not None:
+            return obj.asstr(errors="backslashreplace")[sel].tolist()
+        data = self._read_pooled(obj, sel, shape)
+        vals = self._vec_to_json(data, precision)
+        self._release(data)
+        return vals
+
+    @staticmethod
+    def _leading_selection(shape: tuple, n: int) -> tuple:
+        """Smallest hyperslab that contains the first ``n`` elements in C order."""
+        sel = []
+        for i in range(len(shape)):
+            inner = int(np.prod(shape[i + 1:]))
+            if inner >= n:
+                sel.append(slice(0, 1))
+                continue
+            sel.append(slice(0, -(-n // inner)))
+            sel.extend(slice(None) for _ in shape[i + 1:])
+            break
+        return tuple(sel)
+
     # -- Attributes ---------------------------------------------------
 
     def get_attrs(self, path: str) -> dict:
@@ -228,7 +339,7 @@ class H5Engine:
         if not self.file:
             return {"ok": False, "error": "No file open"}
         try:
-            obj = self.file[path]
+            obj = self._resolve(path)
             attrs = {}
             for key in obj.attrs:
                 try:
@@ -247,7 +358,7 @@ class H5Engine:
         if not self.file:
             return {"ok": False, "error": "No file open"}
         try:
-            obj = self.file[path]
+            obj = self._resolve(path)
             if not isinstance(obj, h5py.Dataset):
                 return {"ok": False, "error": "Not a dataset"}
 
@@ -279,15 +390,27 @@ class H5Engine:
         if not self.file:
             return {"ok": False, "error": "No file open"}
         try:
-            obj = self.file[path]
+            obj = self._resolve(path)
             if not isinstance(obj, h5py.Dataset):
                 return {"ok": False, "error": "Not a dataset"}
 
             if not np.issubdtype(obj.dtype, np.number):
                 return {"ok": False, "error": "Non-numeric dataset"}
 
+            is_float = np.issubdtype(obj.dtype, np.floating)
+            full_max = self.config.get("viewer", {}).get("stats_full_read_bytes", 512 * 1024 * 1024)
+            if obj.nbytes > full_max:
+                stats = self._stream_stats(obj, is_float)
+                if stats is None:
+                    return {"ok": False, "error": "No finite values"}
+                return {"ok": True, "stats": stats}
+
             data = obj[()]
-            finite = data[np.isfinite(data)] if np.issubdtype(obj.dtype, np.floating) else data.flatten()
+            if is_float:
+                finite = data[np.isfinite(data)]
+            else:
+                # Integers are always finite: skip the mask entirely
+                finite = data.ravel()
 
             if len(finite) == 0:
                 return {"ok": False, "error": "No finite values"}
@@ -298,14 +421,77 @@ class H5Engine:
                 "mean": float(np.mean(finite)),
                 "std": float(np.std(finite)),
                 "median": float(np.median(finite)),
-                "total": int(np.prod(data.shape)),
-                "nan_count": int(np.count_nonzero(~np.isfinite(data))) if np.issubdtype(obj.dtype, np.floating) else 0,
-                "unique": int(len(np.unique(finite))) if len(finite) < 1_000_000 else -1,
+                "total": int(data.size),
+                "nan_count": int(data.size - finite.size),
+                "unique": -1,
+                "approximate": False,
             }
+            # Exact distinct count for small data; otherwise count a fixed-size
+            # sample, which gives a lower bound without sorting everything
+            if finite.size <= 100_000:
+                stats["unique"] = int(len(np.unique(finite)))
+            else:
+                sample = np.random.default_rng(0).choice(finite, 100_000, replace=False)
+                stats["unique"] = int(len(np.unique(sample)))
+                stats["approximate"] = True
             return {"ok": True, "stats": stats}
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
+    @staticmethod
+    def _stream_stats(obj, is_float: bool) -> dict | None:
+        """Compute min/max/mean/std block by block without loading the dataset.
+
+        Blocks are slabs along the first axis aligned to the chunk shape. Mean
+        and variance are merged per block (Chan/Welford), so memory stays at
+        one slab. Median and unique count need the full data and are omitted.
+        """
+        shape = obj.shape
+        slab_bytes = int(np.prod(shape[1:])) * obj.dtype.itemsize if len(shape) > 1 else obj.dtype.itemsize
+        step = max(1, (64 << 20) // max(slab_bytes, 1))
+        if obj.chunks:
+            step = max(obj.chunks[0], step // obj.chunks[0] * obj.chunks[0])
+
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        vmin = np.inf
+        vmax = -np.inf
+        for r in range(0, shape[0], step):
+            buf = obj[r:r + step]
+            if is_float:
+                buf = buf[np.isfinite(buf)]
+            else:
+                buf = buf.ravel()
+            n = buf.size
+            if n == 0:
+                continue
+            buf = buf.astype(np.float64, copy=False)
+            b_mean = float(buf.mean())
+            b_m2 = float(np.square(buf - b_mean).sum())
+            vmin = min(vmin, float(buf.min()))
+            vmax = max(vmax, float(buf.max()))
+            total = count + n
+            delta = b_mean - mean
+            mean += delta * n / total
+            m2 += b_m2 + delta * delta * count * n / total
+            count = total
+
+        if count == 0:
+            return None
+        size = int(np.prod(shape))
+        return {
+            "min": vmin,
+            "max": vmax,
+            "mean": mean,
+            "std": float(np.sqrt(m2 / count)),
+            "median": None,
+            "total": size,
+            "nan_count": size - count,
+            "unique": -1,
+            "approximate": False,
+        }
+
     # -- Image Rendering ----------------------------------------------
 
     def get_image_base64(self, path: str) -> dict:
@@ -313,7 +499,7 @@ class H5Engine:
         if not self.file:
             return {"ok": False, "error": "No file open"}
         try:
-            obj = self.file[path]
+            obj = self._resolve(path)
             if not isinstance(obj, h5py.Dataset):
                 return {"ok": False, "error": "Not a dataset"}
 
@@ -324,40 +510,73 @@ class H5Engine:
             if total == 0 or total > max_px:
                 return {"ok": False, "error": f"Image too large ({total} pixels, max {max_px})"}
 
-            data = obj[()].astype(np.float64)
-
-            # Normalize to 0-255
-            dmin, dmax = np.nanmin(data), np.nanmax(data)
-            rng = dmax - dmin if dmax != dmin else 1.0
-            normed = ((data - dmin) / rng * 255).clip(0, 255).astype(np.uint8)
-
-            from PIL import Image
-
-            if len(shape) == 2:
-                img = Image.fromarray(normed, mode="L")
+            if len(shape) == 2 or (len(shape) == 3 and shape[2] == 1):
+                mode = "L"
             elif len(shape) == 3 and shape[2] == 3:
-                img = Image.fromarray(normed, mode="RGB")
+                mode = "RGB"
             elif len(shape) == 3 and shape[2] == 4:
-                img = Image.fromarray(normed, mode="RGBA")
-            elif len(shape) == 3 and shape[2] == 1:
-                img = Image.fromarray(normed[:, :, 0], mode="L")
+                mode = "RGBA"
             else:
                 return {"ok": False, "error": f"Unsupported shape for image: {shape}"}
 
+            from PIL import Image
+
+            raw = self._read_pooled(obj, None, shape)
+            normed = raw if raw.dtype == np.uint8 else self._normalize_u8(raw)
+
+            # frombuffer wraps the contiguous bytes directly, skipping fromarray's
+            # dtype/shape inspection; a trailing 1-channel axis needs no slicing
+            normed = np.ascontiguousarray(normed)
+            img = Image.frombuffer(mode, (shape[1], shape[0]), normed, "raw", mode, 0, 1)
+
+            # Screen preview only: downscale by area averaging and favour fast zlib
+            display_max = self.config.get("viewer", {}).get("image_display_max", 1600)
+            if max(img.size) > display_max:
+                img.thumbnail((display_max, display_max), Image.Resampling.BOX)
+
             buf = io.BytesIO()
-            img.save(buf, format="PNG")
-            b64 = base64.b64encode(buf.getvalue()).decode("ascii")
+            img.save(buf, format="PNG", compress_level=1)
+            self._release(raw)
+            b64 = b64encode_as_string(buf.getvalue())
             return {
                 "ok": True,
                 "data_uri": f"data:image/png;base64,{b64}",
-                "width": img.width,
-                "height": img.height,
+                "width": shape[1],
+                "height": shape[0],
             }
         except ImportError:
             return {"ok": False, "error": "Pillow not installed - run: pip install Pillow"}
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
+    @staticmethod
+    def _normalize_u8(raw: np.ndarray) -> np.ndarray:
+        """Scale an array to 0-255 uint8 (NaN -> 0) in cache-sized blocks.
+
+        Each block runs subtract/scale/clamp/cast through small scratch
+        buffers that stay in cache, so main memory sees one read of ``raw``
+        and one write of the result instead of a full pass per step. The
+        offset is removed in float64 before narrowing to float32, so data
+        with a large baseline keeps its contrast.
+        """
+        dmin, dmax = float(np.nanmin(raw)), float(np.nanmax(raw))
+        scale = 255.0 / (dmax - dmin if dmax != dmin else 1.0)
+        src = np.ascontiguousarray(raw).reshape(-1)
+        out = np.empty(src.size, dtype=np.uint8)
+        block = 1 << 16
+        wide = np.empty(min(block, src.size), dtype=np.float64)
+        tmp = np.empty(min(block, src.size), dtype=np.float32)
+        for start in range(0, src.size, block):
+            stop = min(start + block, src.size)
+            w = wide[:stop - start]
+            t = tmp[:stop - start]
+            np.subtract(src[start:stop], dmin, out=w, dtype=np.float64)
+            np.multiply(w, scale, out=t, casting="same_kind")
+            np.fmax(t, 0, out=t)  # also maps NaN to 0
+            np.minimum(t, 255, out=t)
+            np.copyto(out[start:stop], t, casting="unsafe")
+        return out.reshape(raw.shape)
+
     # -- Export --------------------------------------------------------
 
     def export_csv(self, path: str, save_path: str) -> dict:
@@ -365,40 +584,161 @@ class H5Engine:
         if not self.file:
             return {"ok": False, "error": "No file open"}
         try:
-            obj = self.file[path]
+            obj = self._resolve(path)
             if not isinstance(obj, h5py.Dataset):
                 return {"ok": False, "error": "Not a dataset"}
 
-            sep = self.config.get("export", {}).get("csv_separator", ",")
+            cfg = self.config.get("export", {})
+            sep = cfg.get("csv_separator", ",")
+            eol = cfg.get("csv_line_ending", "\n")
+
+            if obj.shape and obj.dtype.kind in "iuf":
+                self._export_numeric(obj, save_path, sep, eol, cfg.get("float_format", "auto"))
+                return {"ok": True, "path": save_path}
+
             data = obj[()]
 
             with open(save_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f, delimiter=sep)
+                writer = csv.writer(f, delimiter=sep, lineterminator=eol)
                 shape = obj.shape
 
                 if not shape:
                     writer.writerow(["value"])
                     writer.writerow([self._to_json_val(data)])
-                elif len(shape) == 1:
-                    writer.writerow(["index", "value"])
-                    for i, v in enumerate(data):
-                        writer.writerow([i, self._to_json_val(v)])
                 elif len(shape) == 2:
                     writer.writerow([f"col_{c}" for c in range(shape[1])])
-                    for r in range(shape[0]):
-                        writer.writerow([self._to_json_val(data[r, c]) for c in range(shape[1])])
+                    writer.writerows(self._vec_to_json(data))
                 else:
-                    flat = data.flatten()
+                    vals = self._vec_to_json(data.reshape(-1))
                     writer.writerow(["index", "value"])
-                    for i, v in enumerate(flat):
-                        writer.writerow([i, self._to_json_val(v)])
+                    writer.writerows(zip(range(len(vals)), vals))
 
             return {"ok": True, "path": save_path}
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
+    @staticmethod
+    def _export_numeric(obj, save_path: str, sep: str, eol: str, float_fmt: str):
+        """Write a numeric dataset to CSV as pre-joined ~1 MiB byte blocks.
+
+        Values are formatted column-wise with np.char.mod in blocks sized so
+        the formatted text is about 1 MiB (~24 characters per value); numbers
+        never need quoting, so the csv module is bypassed entirely.
+        """
+        shape = obj.shape
+        if obj.dtype.kind in "iu":
+            fmt = "%d"
+        elif float_fmt == "auto":
+            # Shortest %g precision that round-trips the stored width
+            fmt = {2: "%.5g", 4: "%.9g"}.get(obj.dtype.itemsize, "%.17g")
+        else:
+            fmt = float_fmt
+        per_block = (1 << 20) // 24
+
+        with open(save_path, "wb") as f:
+            def emit(lines: list):
+                f.write((eol.join(lines) + eol).encode("utf-8"))
+
+            if len(shape) == 2:
+                emit([sep.join(f"col_{c}" for c in range(shape[1]))])
+                step = max(1, per_block // max(shape[1], 1))
+                for r in range(0, shape[0], step):
+                    block = obj[r:r + step]
+                    if block.size:
+                        emit([sep.join(row) for row in H5Engine._fmt_column(fmt, block).tolist()])
+                return
+
+            # 1D and 3D+: index,value over the flattened data, read in ~16 MiB
+            # slabs along the first axis and formatted in ~1 MiB pieces
+            emit([f"index{sep}value"])
+            slab = int(np.prod(shape[1:])) if len(shape) > 1 else 1
+            step = max(1, (16 << 20) // (max(slab, 1) * obj.dtype.itemsize))
+            offset = 0
+            for r in range(0, shape[0], step):
+                vals = obj[r:r + step].reshape(-1)
+                for s in range(0, vals.size, per_block):
+                    part = vals[s:s + per_block]
+                    idx = np.char.mod("%d", np.arange(offset, offset + part.size))
+                    emit(np.char.add(np.char.add(idx, sep), H5Engine._fmt_column(fmt, part)).tolist())
+                    offset += part.size
+
+    @staticmethod
+    def _fmt_column(fmt: str, vals: np.ndarray) -> np.ndarray:
+        """Format values with np.char.mod, spelling non-finite floats NaN/Inf/-Inf."""
+        out = np.char.mod(fmt, vals)
+        if vals.dtype.kind == "f" and not np.isfinite(vals).all():
+            out[np.isnan(vals)] = "NaN"
+            out[np.isposinf(vals)] = "Inf"
+            out[np.isneginf(vals)] = "-Inf"
+        return out
+
     # -- Helpers -------------------------------------------------------
 
+    def _resolve(self, path: str):
+        """Return ``self.file[path]``, reusing recently opened groups.
+
+        Only groups are cached: an open Dataset keeps its own chunk cache
+        alive, so datasets are opened from their (cached) parent group and
+        released after the call as before.
+        """
+        file = self.file
+        with self._objects_lock:
+            obj = self._objects.get(path)
+            if obj is not None:
+                self._objects.move_to_end(path)
+                return obj
+        parent, _, name = path.rstrip("/").rpartition("/")
+        if not name:
+            obj = file["/"]
+        elif not parent:
+            obj = self._resolve("/")[name] if path.startswith("/") else file[path]
+        else:
+            obj = self._resolve(parent)[name]
+        if isinstance(obj, h5py.Group):
+            with self._objects_lock:
+                # A close()/open() may have raced this lookup; don't cache
+                # objects from a file that is no longer current
+                if self.file is file:
+                    self._objects[path] = obj
+                    while len(self._objects) > self._objects_max:
+                        self._objects.popitem(last=False)
+        return obj
+        obj = self.file[path]
+        with self._objects_lock:
+            self._objects[path] = obj
+            while len(self._objects) > self._objects_max:
+                self._objects.popitem(last=False)
+        return obj
+
+    def _read_pooled(self, obj, sel, shape: tuple) -> np.ndarray:
+        """Read ``obj[sel]`` into a reused buffer via read_direct.
+
+        The buffer is taken out of the pool while in use; hand it back with
+        ``_release`` once nothing references it. Non-numeric dtypes are read
+        normally.
+        """
+        dtype = obj.dtype
+        if dtype.kind not in "iufb":
+            return obj[()] if sel is None else obj[sel]
+        with self._scratch_lock:
+            buf = self._scratch.pop((shape, dtype.str), None)
+        if buf is None:
+            buf = np.empty(shape, dtype=dtype)
+        obj.read_direct(buf, sel)
+        return buf
+
+    def _release(self, buf: np.ndarray):
+        """Return a buffer from ``_read_pooled`` to the pool."""
+        if buf.dtype.kind not in "iufb" or buf.nbytes > self._scratch_max_bytes // 4:
+            return
+        key = (buf.shape, buf.dtype.str)
+        with self._scratch_lock:
+            self._scratch[key] = buf
+            self._scratch.move_to_end(key)
+            while (len(self._scratch) > self._scratch_max
+                   or sum(b.nbytes for b in self._scratch.values()) > self._scratch_max_bytes):
+                self._scratch.popitem(last=False)
+
     def _to_json_val(self, val, precision: int = 8):
         """Convert a numpy/HDF5 value to a JSON-friendly Python type."""
         if isinstance(val, (bytes, np.bytes_)):
@@ -425,14 +765,48 @@ class H5Engine:
             return str(val)
         return str(val)
 
+    def _vec_to_json(self, data: np.ndarray, precision: int = 8) -> list:
+        """Convert a whole array to nested JSON-friendly lists, dispatching on dtype kind.
+
+        Rounding, decoding and the Python-scalar conversion happen inside NumPy;
+        only non-finite float cells are patched afterwards. Remaining dtypes
+        (compound, object) fall back to per-element ``_to_json_val``.
+        """
+        kind = data.dtype.kind
+        if kind in "iubU":
+            return data.tolist()
+        if kind == "S":
+            return np.char.decode(data, "utf-8", "backslashreplace").tolist()
+        if kind != "f":
+            if data.ndim <= 1:
+                return [self._to_json_val(v, precision) for v in data]
+            return [self._vec_to_json(row, precision) for row in data]
+
+        # Only round values that still have fractional digits at float64
+        # precision; scaling huge ones by 10**precision would overflow to inf
+        out = data.astype(np.float64)
+        small = np.abs(out) < 10.0 ** (15 - precision)
+        out[small] = np.round(out[small], precision)
+        lst = out.tolist()
+        if np.isfinite(data).all():
+            return lst
+        # Patch only the non-finite cells of the input; the index loops are
+        # as short as the number of bad values
+        for mask, label in ((np.isnan(data), "NaN"), (np.isposinf(data), "Inf"), (np.isneginf(data), "-Inf")):
+            for i in np.flatnonzero(mask):
+                *head, last = np.unravel_index(i, data.shape)
+                row = lst
+                for j in head:
+                    row = row[j]
+                row[last] = label
+        return lst
+
     @staticmethod
     def _fmt_bytes(b: int) -> str:
-        if b == 0:
+        if b <= 0:
             return "0 B"
-        units = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        fb = float(b)
-        while fb >= 1024 and i < len(units) - 1:
-            fb /= 1024
-            i += 1
-        return f"{fb:.1f} {units[i]}" if i > 0 else f"{b} B"
+        # Unit index straight from the bit length instead of a divide loop
+        i = min((b.bit_length() - 1) // 10, 4)
+        if i == 0:
+            return f"{b} B"
+        return f"{b / (1 << (i * 10)):.1f} {('B', 'KB', 'MB', 'GB', 'TB')[i]}"